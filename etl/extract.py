@@ -1,23 +1,40 @@
+import io
+import typing as t
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
 
 import pandas as pd
+from pandas.api.types import is_string_dtype
 
 from logging_config import logger
 
+# Size of the blocks scanned when aligning byte ranges on record boundaries
+BLOCK_SIZE = 16 * 1024 * 1024
 
-def extract(file_path: Path) -> pd.DataFrame:
+# Default size of the byte ranges parsed by worker processes
+RANGE_SIZE = 32 * 1024 * 1024
+
+
+def extract(file_path: Path, workers: int = None, csv_engine: str = None, range_size: int = RANGE_SIZE) -> pd.DataFrame:
     """
     Extract data from a CSV file and log key dataset information.
 
     Args:
         file_path (Path): Path to the CSV file.
+        workers (int, optional): Number of worker processes parsing byte ranges of the file. Defaults to None (single process).
+        csv_engine (str, optional): Parser engine passed to `pd.read_csv`, e.g. "pyarrow". Defaults to None.
+        range_size (int, optional): Approximate size in bytes of the ranges parsed by the workers. Defaults to RANGE_SIZE.
 
     Returns:
         pd.DataFrame: Extracted data as a DataFrame.
     """
     try:
         # Read data from the specified file path
-        data = pd.read_csv(file_path)
+        if workers and workers > 1:
+            data = _extract_parallel(file_path, workers, csv_engine, range_size)
+        else:
+            data = pd.read_csv(file_path, engine=csv_engine)
 
         # Log dataset details
         logger.info("Extracting data from %s", file_path)
@@ -34,3 +51,178 @@ def extract(file_path: Path) -> pd.DataFrame:
         # Log any other errors encountered during extraction
         logger.error("An error occurred while extracting data from %s: %s", file_path, str(e))
         raise
+
+
+def extract_chunks(file_path: Path, workers: int, csv_engine: str = None, range_size: int = RANGE_SIZE) -> t.Iterator[pd.DataFrame]:
+    """
+    Split a CSV file into byte ranges aligned on record boundaries and parse them in parallel.
+
+    At most two ranges per worker are parsed ahead of the consumer, so memory use is bounded
+    by the range size rather than the file size. Column types are inferred per range, so a
+    column may get different types in different chunks.
+
+    Args:
+        file_path (Path): Path to the CSV file.
+        workers (int): Number of worker processes.
+        csv_engine (str, optional): Parser engine passed to `pd.read_csv`, e.g. "pyarrow". Defaults to None.
+        range_size (int, optional): Approximate size in bytes of each range. Defaults to RANGE_SIZE.
+
+    Returns:
+        t.Iterator[pd.DataFrame]: Parsed chunks in file order.
+    """
+    header, ranges = _split_ranges(file_path, workers, range_size)
+    logger.info("Parsing %s in %d byte ranges with %d workers...", file_path, len(ranges), workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _parse_ranges(executor, workers, [(file_path, header, start, end, csv_engine) for start, end in ranges])
+
+
+def _extract_parallel(file_path: Path, workers: int, csv_engine: str = None, range_size: int = RANGE_SIZE) -> pd.DataFrame:
+    """
+    Parse byte ranges of a CSV file in parallel and combine them with consistent column types.
+
+    Columns that are text in some ranges but not in others are parsed again as text in those
+    ranges, so values such as leading zeros keep their original form, as in a single-process read.
+    Only the affected columns are parsed again.
+
+    Args:
+        file_path (Path): Path to the CSV file.
+        workers (int): Number of worker processes.
+        csv_engine (str, optional): Parser engine passed to `pd.read_csv`, e.g. "pyarrow". Defaults to None.
+        range_size (int, optional): Approximate size in bytes of each range. Defaults to RANGE_SIZE.
+
+    Returns:
+        pd.DataFrame: Combined DataFrame.
+    """
+    header, ranges = _split_ranges(file_path, workers, range_size)
+    logger.info("Parsing %s in %d byte ranges with %d workers...", file_path, len(ranges), workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = list(_parse_ranges(executor, workers, [(file_path, header, start, end, csv_engine) for start, end in ranges]))
+
+        # Columns inferred as text in some ranges and as another type in others
+        text = {column: [is_string_dtype(chunk[column]) for chunk in chunks] for column in chunks[0].columns}
+        text_columns = [column for column, flags in text.items() if any(flags) and not all(flags)]
+        if text_columns:
+            indexes = [index for index in range(len(chunks)) if not all(text[column][index] for column in text_columns)]
+            logger.info("Parsing %d byte ranges again with %s read as text...", len(indexes), text_columns)
+            dtype = dict.fromkeys(text_columns, str)
+            tasks = [(file_path, header, *ranges[index], csv_engine, dtype, text_columns) for index in indexes]
+            for index, columns in zip(indexes, _parse_ranges(executor, workers, tasks)):
+                chunks[index] = chunks[index].assign(**{column: columns[column] for column in text_columns})
+
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _parse_ranges(executor: Executor, workers: int, tasks: t.List[t.Tuple[t.Any, ...]]) -> t.Iterator[pd.DataFrame]:
+    """
+    Parse byte ranges in an executor, keeping at most two ranges per worker in flight.
+
+    Args:
+        executor (Executor): Executor running `_read_range`.
+        workers (int): Number of worker processes of the executor.
+        tasks (t.List[t.Tuple[t.Any, ...]]): Arguments of `_read_range` for each range.
+
+    Returns:
+        t.Iterator[pd.DataFrame]: Parsed ranges in task order.
+    """
+    remaining = iter(tasks)
+    pending = deque(executor.submit(_read_range, *task) for _, task in zip(range(2 * workers), remaining))
+    try:
+        while pending:
+            chunk = pending.popleft().result()
+            task = next(remaining, None)
+            if task is not None:
+                pending.append(executor.submit(_read_range, *task))
+            yield chunk
+    finally:
+        # Stop parsing ahead when the consumer stops early
+        for future in pending:
+            future.cancel()
+
+
+def _split_ranges(file_path: Path, workers: int, range_size: int) -> t.Tuple[bytes, t.List[t.Tuple[int, int]]]:
+    """
+    Split a CSV file into byte ranges starting on record boundaries.
+
+    The file is split into ranges of about `range_size` bytes, and into at least one range per worker.
+
+    Args:
+        file_path (Path): Path to the CSV file.
+        workers (int): Number of worker processes.
+        range_size (int): Approximate size in bytes of each range.
+
+    Returns:
+        t.Tuple[bytes, t.List[t.Tuple[int, int]]]: Header line of the file, and start and end offsets of the ranges.
+    """
+    size = file_path.stat().st_size
+    parts = max(workers, -(-size // range_size))
+    boundaries = _align_offsets(file_path, [0] + [size * i // parts for i in range(1, parts)])
+    starts = sorted(set(boundaries))
+    # A header-only file yields one empty range, parsed into an empty DataFrame with the header's columns
+    ranges = [(start, end) for start, end in zip(starts, starts[1:] + [size]) if start < end] or [(size, size)]
+
+    with file_path.open("rb") as file:
+        header = file.read(boundaries[0])
+    return header, ranges
+
+
+def _align_offsets(file_path: Path, offsets: t.List[int]) -> t.List[int]:
+    """
+    Move each offset forward to the start of the next record.
+
+    A newline ends a record only outside quoted fields, i.e. when an even number of quote
+    characters precedes it, so quoted values with embedded commas and newlines stay intact.
+
+    Args:
+        file_path (Path): Path to the CSV file.
+        offsets (t.List[int]): Ascending byte offsets to align.
+
+    Returns:
+        t.List[int]: Aligned offsets, or the file size for offsets past the last record.
+    """
+    aligned = []
+    pending = iter(offsets)
+    target = next(pending, None)
+    quotes = 0
+    position = 0
+
+    with file_path.open("rb") as file:
+        while target is not None:
+            block = file.read(BLOCK_SIZE)
+            if not block:
+                break
+            cursor = 0
+            while target is not None:
+                newline = block.find(b"\n", max(cursor, target - position))
+                if newline == -1:
+                    break
+                quotes += block.count(b'"', cursor, newline)
+                cursor = newline + 1
+                if quotes % 2 == 0:
+                    aligned.append(position + cursor)
+                    target = next(pending, None)
+            quotes += block.count(b'"', cursor)
+            position += len(block)
+
+    return aligned + [position] * (len(offsets) - len(aligned))
+
+
+def _read_range(file_path: Path, header: bytes, start: int, end: int, csv_engine: str = None, dtype: t.Dict[str, t.Any] = None, usecols: t.List[str] = None) -> pd.DataFrame:
+    """
+    Parse the records within a byte range of a CSV file.
+
+    Args:
+        file_path (Path): Path to the CSV file.
+        header (bytes): Header line of the file, prepended to the range.
+        start (int): Offset of the first byte of the range.
+        end (int): Offset past the last byte of the range.
+        csv_engine (str, optional): Parser engine passed to `pd.read_csv`. Defaults to None.
+        dtype (t.Dict[str, t.Any], optional): Column types passed to `pd.read_csv`. Defaults to None.
+        usecols (t.List[str], optional): Columns to parse, passed to `pd.read_csv`. Defaults to None (all columns).
+
+    Returns:
+        pd.DataFrame: Records of the range.
+    """
+    with file_path.open("rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+    return pd.read_csv(io.BytesIO(header + data), engine=csv_engine, dtype=dtype, usecols=usecols)
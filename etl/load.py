@@ -1,18 +1,45 @@
+import hashlib
+import time
+import typing as t
+from datetime import datetime, timezone
+
 import pandas as pd
-from sqlalchemy import create_engine
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import BigInteger, Column, DateTime, Integer, MetaData, String, Table, create_engine, delete, func, inspect, select
+from sqlalchemy import table as table_clause
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError, DisconnectionError, SQLAlchemyError
 
 from logging_config import logger
 
+metadata = MetaData()
+checkpoints = Table(
+    "etl_load_checkpoints",
+    metadata,
+    Column("table_name", String(255), primary_key=True),
+    Column("batch_id", String(255), primary_key=True),
+    Column("chunk_offset", BigInteger, primary_key=True),
+    Column("chunk_size", Integer, nullable=False),
+    Column("row_count", Integer, nullable=False),
+    Column("loaded_at", DateTime, nullable=False),
+)
+
 
-def load(data: pd.DataFrame, table_name: str, db_connection_string: str) -> None:
+def load(data: pd.DataFrame, table_name: str, db_connection_string: str, chunk_size: int = None, batch_id: str = None, max_retries: int = 3, backoff: float = 1.0) -> None:
     """
     Load a DataFrame into a specific table in the PostgreSQL database.
 
+    When `chunk_size` is set, the data is loaded in chunks and every committed chunk is recorded
+    in the `etl_load_checkpoints` table, so a restarted run with the same batch id skips them.
+    The checkpoints are removed once the load completes, or when the table is replaced by another load.
+
     Args:
         data (pd.DataFrame): DataFrame containing the data to load.
         table_name (str): Name of the table in the database.
         db_connection_string (str): Connection string for the PostgreSQL database.
+        chunk_size (int, optional): Number of rows per checkpointed chunk. Defaults to None (single load).
+        batch_id (str, optional): Identifier of the load used to resume it. Defaults to a hash of the data.
+        max_retries (int, optional): Retries per chunk when the database connection drops. Defaults to 3.
+        backoff (float, optional): Delay in seconds before the first retry, doubled on each attempt. Defaults to 1.0.
 
     Returns:
         None
@@ -27,9 +54,223 @@ def load(data: pd.DataFrame, table_name: str, db_connection_string: str) -> None
 
         # Load data into the specified table
         logger.info("Loading data into the '%s' table...", table_name)
-        data.to_sql(table_name, engine, if_exists="replace", index=False)
+        if chunk_size:
+            batch_id = batch_id or _default_batch_id(data, table_name, chunk_size)
+            _load_in_chunks(data, table_name, engine, chunk_size, batch_id, max_retries, backoff)
+        else:
+            with engine.begin() as conn:
+                _delete_checkpoints(conn, table_name)
+                data.to_sql(table_name, conn, if_exists="replace", index=False)
         logger.info("Data successfully loaded into the '%s' table!", table_name)
 
     except SQLAlchemyError as e:
         logger.error("An error occurred while loading data into '%s': %s", table_name, e)
         raise
+
+
+def _default_batch_id(data: pd.DataFrame, table_name: str, chunk_size: int) -> str:
+    """
+    Derive a batch id that stays the same across restarts for identical data and chunking.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the data to load.
+        table_name (str): Name of the table in the database.
+        chunk_size (int): Number of rows per chunk.
+
+    Returns:
+        str: Batch id of the load.
+    """
+    digest = hashlib.sha1(pd.util.hash_pandas_object(data, index=False).values.tobytes())
+    digest.update(",".join(map(str, data.columns)).encode())
+    return f"{table_name}-{chunk_size}-{digest.hexdigest()[:16]}"
+
+
+def _is_disconnect(error: SQLAlchemyError) -> bool:
+    """
+    Check whether an error was caused by a dropped database connection, as opposed to a permanent failure.
+
+    Args:
+        error (SQLAlchemyError): Error raised by SQLAlchemy.
+
+    Returns:
+        bool: True if retrying on a new connection may succeed.
+    """
+    return isinstance(error, DisconnectionError) or (isinstance(error, DBAPIError) and error.connection_invalidated)
+
+
+def _retry(func: t.Callable[..., t.Any], *args: t.Any, max_retries: int, backoff: float) -> t.Any:
+    """
+    Call a function, retrying with exponential backoff when the database connection drops.
+
+    Args:
+        func (t.Callable[..., t.Any]): Function to call.
+        *args (t.Any): Positional arguments for the function.
+        max_retries (int): Maximum number of retries.
+        backoff (float): Delay in seconds before the first retry.
+
+    Returns:
+        t.Any: Result of the function.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return func(*args)
+        except SQLAlchemyError as e:
+            if not _is_disconnect(e) or attempt == max_retries:
+                raise
+            delay = backoff * 2**attempt
+            logger.warning("Database connection lost (attempt %d of %d): %s. Retrying in %.1f seconds...", attempt + 1, max_retries + 1, e, delay)
+            time.sleep(delay)
+
+
+def _delete_checkpoints(conn: Connection, table_name: str) -> None:
+    """
+    Remove the checkpoints of all batches of a table, as they no longer describe what it holds.
+
+    Args:
+        conn (Connection): SQLAlchemy connection within the transaction replacing the table.
+        table_name (str): Name of the table in the database.
+
+    Returns:
+        None
+    """
+    if inspect(conn).has_table(checkpoints.name):
+        conn.execute(delete(checkpoints).where(checkpoints.c.table_name == table_name))
+
+
+def _resumable_offsets(engine: Engine, table_name: str, batch_id: str, chunk_size: int) -> t.Set[int]:
+    """
+    Fetch the offsets of chunks already committed for a batch, if the table still holds exactly those chunks.
+
+    Args:
+        engine (Engine): SQLAlchemy engine connected to the database.
+        table_name (str): Name of the table in the database.
+        batch_id (str): Batch id of the load.
+        chunk_size (int): Number of rows per chunk.
+
+    Returns:
+        t.Set[int]: Offsets of the committed chunks, or an empty set if the batch must start over.
+    """
+    metadata.create_all(engine, tables=[checkpoints])
+    with engine.connect() as conn:
+        rows = conn.execute(select(checkpoints.c.chunk_offset, checkpoints.c.chunk_size, checkpoints.c.row_count).where(checkpoints.c.table_name == table_name, checkpoints.c.batch_id == batch_id)).all()
+        if not rows:
+            return set()
+
+        chunk_sizes = {row.chunk_size for row in rows}
+        if chunk_sizes != {chunk_size}:
+            raise ValueError(f"Cannot resume batch '{batch_id}' with chunk_size={chunk_size}: it was started with chunk_size={chunk_sizes.pop()}")
+
+        # The table may have been dropped or modified since the interrupted run
+        row_count = conn.execute(select(func.count()).select_from(table_clause(table_name))).scalar() if inspect(conn).has_table(table_name) else None
+        if row_count != sum(row.row_count for row in rows):
+            logger.warning("The '%s' table no longer matches the checkpoints of batch '%s'. Starting over...", table_name, batch_id)
+            return set()
+
+    return {row.chunk_offset for row in rows}
+
+
+def _clear_checkpoints(engine: Engine, table_name: str, batch_id: str) -> None:
+    """
+    Remove the checkpoints of a completed batch.
+
+    Args:
+        engine (Engine): SQLAlchemy engine connected to the database.
+        table_name (str): Name of the table in the database.
+        batch_id (str): Batch id of the load.
+
+    Returns:
+        None
+    """
+    with engine.begin() as conn:
+        conn.execute(delete(checkpoints).where(checkpoints.c.table_name == table_name, checkpoints.c.batch_id == batch_id))
+
+
+def _load_chunk(engine: Engine, chunk: pd.DataFrame, table_name: str, batch_id: str, chunk_size: int, offset: int) -> None:
+    """
+    Append a chunk and record its checkpoint in the same transaction.
+
+    Args:
+        engine (Engine): SQLAlchemy engine connected to the database.
+        chunk (pd.DataFrame): Rows of the chunk.
+        table_name (str): Name of the table in the database.
+        batch_id (str): Batch id of the load.
+        chunk_size (int): Number of rows per chunk.
+        offset (int): Row offset of the chunk within the data.
+
+    Returns:
+        None
+    """
+    with engine.begin() as conn:
+        # A retried chunk may have been committed before the connection dropped
+        done = conn.execute(select(checkpoints.c.chunk_offset).where(checkpoints.c.table_name == table_name, checkpoints.c.batch_id == batch_id, checkpoints.c.chunk_offset == offset)).first()
+        if done:
+            return
+        chunk.to_sql(table_name, conn, if_exists="append", index=False)
+        conn.execute(
+            checkpoints.insert().values(
+                table_name=table_name,
+                batch_id=batch_id,
+                chunk_offset=offset,
+                chunk_size=chunk_size,
+                row_count=len(chunk),
+                loaded_at=datetime.now(timezone.utc).replace(tzinfo=None),
+            )
+        )
+
+
+def _replace_table(data: pd.DataFrame, table_name: str, engine: Engine) -> None:
+    """
+    Create an empty table with the columns of the DataFrame, replacing any existing one.
+
+    Checkpoints of earlier batches are removed in the same transaction, as they no longer
+    describe what the table holds.
+
+    Args:
+        data (pd.DataFrame): DataFrame whose columns define the table.
+        table_name (str): Name of the table in the database.
+        engine (Engine): SQLAlchemy engine connected to the database.
+
+    Returns:
+        None
+    """
+    with engine.begin() as conn:
+        _delete_checkpoints(conn, table_name)
+        data.head(0).to_sql(table_name, conn, if_exists="replace", index=False)
+
+
+def _load_in_chunks(data: pd.DataFrame, table_name: str, engine: Engine, chunk_size: int, batch_id: str, max_retries: int, backoff: float) -> None:
+    """
+    Load a DataFrame chunk by chunk, skipping chunks already committed for the batch.
+
+    Resuming a batch requires the same `chunk_size` as the interrupted run. If the table no
+    longer holds exactly the committed chunks, the batch starts over.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the data to load.
+        table_name (str): Name of the table in the database.
+        engine (Engine): SQLAlchemy engine connected to the database.
+        chunk_size (int): Number of rows per chunk.
+        batch_id (str): Batch id of the load.
+        max_retries (int): Retries per chunk when the database connection drops.
+        backoff (float): Delay in seconds before the first retry.
+
+    Returns:
+        None
+    """
+    completed = _retry(_resumable_offsets, engine, table_name, batch_id, chunk_size, max_retries=max_retries, backoff=backoff)
+    offsets = range(0, len(data), chunk_size)
+
+    if completed:
+        logger.info("Resuming batch '%s': skipping %d of %d chunks already loaded.", batch_id, len(completed), len(offsets))
+    else:
+        # Fresh batch: replace the table, keeping the column types of the whole DataFrame
+        _retry(_replace_table, data, table_name, engine, max_retries=max_retries, backoff=backoff)
+
+    for offset in offsets:
+        if offset in completed:
+            continue
+        logger.info("Loading rows %d-%d of %d into the '%s' table...", offset + 1, min(offset + chunk_size, len(data)), len(data), table_name)
+        _retry(_load_chunk, engine, data.iloc[offset : offset + chunk_size], table_name, batch_id, chunk_size, offset, max_retries=max_retries, backoff=backoff)
+
+    # All chunks are committed: a later run with the same batch id loads the data again
+    _retry(_clear_checkpoints, engine, table_name, batch_id, max_retries=max_retries, backoff=backoff)
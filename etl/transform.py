@@ -1,9 +1,18 @@
+import re
 import typing as t
 
 import pandas as pd
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.types import Float, Integer, Numeric
 
 from logging_config import logger
 
+# Columns coerced to numbers, mirroring pd.to_numeric(..., errors="coerce")
+_NUMERIC_COLUMNS = ("Rating", "Reviews")
+_NUMERIC_PATTERN = r"^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$"
+
 
 def transform(apps: pd.DataFrame, reviews: pd.DataFrame = None, **kwargs: t.Any) -> pd.DataFrame:
     """
@@ -88,3 +97,177 @@ def transform(apps: pd.DataFrame, reviews: pd.DataFrame = None, **kwargs: t.Any)
     except Exception as e:
         logger.error("An error occurred during data transformation: %s", e)
         raise
+
+
+def _to_numeric(expression: str, dialect_name: str) -> str:
+    """
+    Build a SQL expression that converts a column to a number, yielding NULL for unparsable values.
+
+    Args:
+        expression (str): SQL expression of the column to convert.
+        dialect_name (str): Name of the SQLAlchemy dialect the query is compiled for.
+
+    Returns:
+        str: SQL expression producing the numeric value.
+    """
+    if dialect_name == "postgresql":
+        return f"CASE WHEN CAST({expression} AS TEXT) ~ :numeric_pattern THEN CAST({expression} AS DOUBLE PRECISION) END"
+    if dialect_name == "sqlite":
+        return f"CASE WHEN CAST({expression} AS TEXT) REGEXP :numeric_pattern THEN CAST({expression} AS REAL) END"
+    raise ValueError(f"Converting text columns to numeric is not supported for the '{dialect_name}' dialect")
+
+
+def _register_regexp(dbapi_connection: t.Any, connection_record: t.Any) -> None:
+    """
+    Register the REGEXP function used by `_to_numeric` on a SQLite connection.
+
+    Args:
+        dbapi_connection (t.Any): Raw SQLite connection.
+        connection_record (t.Any): Connection pool record.
+
+    Returns:
+        None
+    """
+    dbapi_connection.create_function("REGEXP", 2, lambda pattern, value: value is not None and re.search(pattern, value) is not None, deterministic=True)
+
+
+def _build_transform_query(engine: Engine, apps_table: str, target_table: str, reviews_table: str = None, if_exists: str = "replace", **kwargs: t.Any) -> t.Tuple[str, t.Dict[str, t.Any]]:
+    """
+    Compile the `transform` parameters into a single parameterized SQL statement.
+
+    On SQLite the statement relies on the REGEXP function registered by `transform_in_db`.
+
+    Args:
+        engine (Engine): SQLAlchemy engine connected to the database holding the source tables.
+        apps_table (str): Name of the table containing app information.
+        target_table (str): Name of the table to create or append to.
+        reviews_table (str, optional): Name of the table containing review information. Defaults to None.
+        if_exists (str, optional): "replace" compiles to CREATE TABLE AS, "append" to INSERT ... SELECT. Defaults to "replace".
+        **kwargs (t.Any): Transformation parameters, as accepted by `transform`.
+
+    Returns:
+        t.Tuple[str, t.Dict[str, t.Any]]: SQL statement and its bound parameters.
+    """
+    inspector = inspect(engine)
+    quote = engine.dialect.identifier_preparer.quote
+    params = {}
+
+    # Select every apps column, converting 'Rating' and 'Reviews' to numeric when stored as text
+    apps_columns = {column["name"]: column["type"] for column in inspector.get_columns(apps_table)}
+    columns = {}
+    for name, column_type in apps_columns.items():
+        expression = f"a.{quote(name)}"
+        if name in _NUMERIC_COLUMNS and not isinstance(column_type, (Float, Integer, Numeric)):
+            expression = _to_numeric(expression, engine.dialect.name)
+            params["numeric_pattern"] = _NUMERIC_PATTERN
+        columns[name] = expression
+
+    # Filter by category if provided
+    conditions = []
+    category = kwargs.get("category")
+    if category:
+        if "Category" not in apps_columns:
+            raise KeyError("Category")
+        conditions.append(f"a.{quote('Category')} = :category")
+        params["category"] = category
+
+    # Join reviews, aggregated per app or row by row
+    join = ""
+    if reviews_table is not None:
+        reviews_columns = [column["name"] for column in inspector.get_columns(reviews_table)]
+        if "App" not in reviews_columns:
+            logger.warning("The '%s' table does not contain an 'App' column. Skipping review processing.", reviews_table)
+        elif "Sentiment_Polarity" not in reviews_columns:
+            raise KeyError("Sentiment_Polarity")
+        else:
+            app, polarity = quote("App"), quote("Sentiment_Polarity")
+            if kwargs.get("aggregate_reviews", False):
+                # Average only the reviews of the apps kept by the category filter
+                restriction = f" WHERE {app} IN (SELECT {app} FROM {quote(apps_table)} WHERE {quote('Category')} = :category)" if category else ""
+                source = f"(SELECT {app}, AVG({polarity}) AS {polarity} FROM {quote(reviews_table)}{restriction} GROUP BY {app})"
+                suffix = "_agg"
+            else:
+                source = quote(reviews_table)
+                suffix = "_review"
+            join = f" LEFT JOIN {source} r ON a.{app} = r.{app}"
+            columns["Sentiment_Polarity" + suffix if "Sentiment_Polarity" in columns else "Sentiment_Polarity"] = f"r.{polarity}"
+
+    # Keep only specified columns
+    columns_to_keep = kwargs.get("columns_to_keep")
+    if columns_to_keep:
+        missing = [name for name in columns_to_keep if name not in columns]
+        if missing:
+            raise KeyError(f"Columns not found: {missing}")
+        columns = {name: columns[name] for name in columns_to_keep}
+
+    # Apply filtering conditions (e.g., min_rating, min_reviews)
+    for key, name in (("min_rating", "Rating"), ("min_reviews", "Reviews")):
+        value = kwargs.get(key)
+        if value is not None:
+            if name not in columns:
+                raise KeyError(name)
+            conditions.append(f"{columns[name]} > :{key}")
+            params[key] = value
+
+    # Sort in descending order, keeping missing values last as pandas does
+    order_by = ""
+    sort_by = kwargs.get("sort_by")
+    if sort_by:
+        sort_by = [sort_by] if isinstance(sort_by, str) else sort_by
+        missing = [name for name in sort_by if name not in columns]
+        if missing:
+            raise KeyError(f"Columns not found: {missing}")
+        order_by = " ORDER BY " + ", ".join(f"{columns[name]} DESC NULLS LAST" for name in sort_by)
+
+    select_list = ", ".join(f"{expression} AS {quote(name)}" for name, expression in columns.items())
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    query = f"SELECT {select_list} FROM {quote(apps_table)} a{join}{where}{order_by}"
+
+    if if_exists == "append":
+        target_columns = ", ".join(quote(name) for name in columns)
+        return f"INSERT INTO {quote(target_table)} ({target_columns}) {query}", params
+    return f"CREATE TABLE {quote(target_table)} AS {query}", params
+
+
+def transform_in_db(apps_table: str, target_table: str, db_connection_string: str, reviews_table: str = None, if_exists: str = "replace", **kwargs: t.Any) -> None:
+    """
+    Transform data inside the database, building the target table without a round trip through pandas.
+
+    Args:
+        apps_table (str): Name of the table containing app information.
+        target_table (str): Name of the table to build from the transformed data.
+        db_connection_string (str): Connection string for the database.
+        reviews_table (str, optional): Name of the table containing review information. Defaults to None.
+        if_exists (str, optional): "replace" to rebuild the target table, "append" to insert into it. Defaults to "replace".
+        **kwargs (t.Any): Transformation parameters, as accepted by `transform`.
+
+    Returns:
+        None
+    """
+    for table_name in (apps_table, target_table, reviews_table):
+        if table_name is not None and not table_name.isidentifier():
+            raise ValueError(f"Invalid table name: '{table_name}'")
+    if if_exists not in ("replace", "append"):
+        raise ValueError(f"Invalid if_exists value: '{if_exists}'")
+    if if_exists == "replace" and target_table in (apps_table, reviews_table):
+        raise ValueError(f"Cannot replace source table '{target_table}' with its own transformation")
+    if kwargs.get("drop_duplicates", False):
+        raise ValueError("drop_duplicates is not supported when transforming inside the database")
+
+    try:
+        logger.info("Connecting to the database to transform '%s' into '%s'...", apps_table, target_table)
+        engine = create_engine(db_connection_string)
+        if engine.dialect.name == "sqlite":
+            event.listen(engine, "connect", _register_regexp)
+        query, params = _build_transform_query(engine, apps_table, target_table, reviews_table, if_exists, **kwargs)
+
+        logger.info("Running database-side transformation into the '%s' table...", target_table)
+        with engine.begin() as conn:
+            if if_exists == "replace":
+                conn.execute(text(f"DROP TABLE IF EXISTS {engine.dialect.identifier_preparer.quote(target_table)}"))
+            conn.execute(text(query), params)
+        logger.info("Database-side transformation into the '%s' table completed successfully!", target_table)
+
+    except SQLAlchemyError as e:
+        logger.error("An error occurred during database-side transformation into '%s': %s", target_table, e)
+        raise
@@ -43,7 +43,7 @@ def main() -> None:
         logger.info("Starting data loading...")
         load(apps_data, "apps_data", db_connection_string)
         load(filtered_apps_data, "filtered_apps_data", db_connection_string)
-        load(reviews_data, "reviews_data", db_connection_string)
+        load(reviews_data, "reviews_data", db_connection_string, chunk_size=10000)
 
         logger.info("ETL pipeline completed successfully!")
 
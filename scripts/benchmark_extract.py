@@ -0,0 +1,58 @@
+# Usage: python scripts/benchmark_extract.py [size_mb] [range_size_mb]
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from etl.extract import extract  # noqa: E402
+
+
+def build_csv(source: Path, target: Path, size_mb: int) -> None:
+    """
+    Build a large CSV file by repeating the records of a source CSV file.
+
+    Args:
+        source (Path): Path to the source CSV file.
+        target (Path): Path to the CSV file to build.
+        size_mb (int): Approximate size of the built file in megabytes.
+    """
+    header, records = source.read_bytes().split(b"\n", 1)
+    records = records.rstrip(b"\n") + b"\n"
+    with target.open("wb") as file:
+        file.write(header + b"\n")
+        while file.tell() < size_mb * 1024 * 1024:
+            file.write(records)
+
+
+def benchmark(file_path: Path, range_size: int) -> None:
+    """
+    Time single-process and parallel extraction for an increasing number of workers.
+
+    Args:
+        file_path (Path): Path to the CSV file.
+        range_size (int): Size in bytes of the ranges parsed by the workers.
+    """
+    size_mb = file_path.stat().st_size / 1024 / 1024
+    cpu_count = os.cpu_count() or 1
+    worker_counts = [1] + [workers for workers in (2, 4, 8, 16, 32) if workers <= cpu_count]
+
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        extract(file_path, workers=workers, range_size=range_size)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"workers={workers:>2}  {elapsed:6.2f} s  {size_mb / elapsed:7.1f} MB/s  speedup x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    range_size_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_file = Path(temp_dir) / "apps_data_large.csv"
+        build_csv(Path("raw_data/apps_data.csv"), csv_file, size_mb)
+        print(f"Benchmarking extract on {size_mb} MB with {os.cpu_count()} CPUs...", file=sys.stderr)
+        benchmark(csv_file, range_size_mb * 1024 * 1024)
@@ -1,9 +1,10 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pandas as pd
 import pytest
 
-from etl.extract import extract
+from etl.extract import _align_offsets, extract, extract_chunks
 
 
 @pytest.mark.unit
@@ -71,3 +72,198 @@ class TestExtract:
             sample_csv,
             "Test exception",  # String representation of the exception
         )
+
+    # Parallel extraction tests
+    def test_extract_parallel_matches_single(self, quoted_csv: Path) -> None:
+        """
+        Tests that parallel extraction returns the same data as a single-process read.
+
+        Args:
+            quoted_csv (Path): Path to a CSV file with quoted fields.
+
+        Returns:
+            None
+        """
+        expected = extract(quoted_csv)
+        for workers in (2, 3, 8):
+            pd.testing.assert_frame_equal(extract(quoted_csv, workers=workers), expected)
+
+    def test_extract_parallel_keeps_leading_zeros(self, tmp_path: Path) -> None:
+        """
+        Tests that a column read as text keeps leading zeros in ranges parsed as numbers.
+
+        Args:
+            tmp_path (Path): Temporary directory for test files.
+
+        Returns:
+            None
+        """
+        file = tmp_path / "codes.csv"
+        codes = [f"{i:03d}" for i in range(40)] + ["X40"]
+        file.write_text("Code,Value\n" + "".join(f"{code},{i}\n" for i, code in enumerate(codes)))
+
+        expected = extract(file)
+        df = extract(file, workers=4)
+        pd.testing.assert_frame_equal(df, expected)
+        assert df["Code"].tolist()[:3] == ["000", "001", "002"]
+
+    def test_extract_parallel_missing_values_in_numeric_range(self, tmp_path: Path) -> None:
+        """
+        Tests that a range parsed as floats because of a missing value is read again as text.
+
+        Args:
+            tmp_path (Path): Temporary directory for test files.
+
+        Returns:
+            None
+        """
+        file = tmp_path / "missing.csv"
+        values = [str(i) for i in range(20)] + [""] + [str(i) for i in range(21, 40)] + ["abc"]
+        file.write_text("Value,Other\n" + "".join(f"{value},{i}\n" for i, value in enumerate(values)))
+
+        expected = extract(file)
+        df = extract(file, workers=4)
+        pd.testing.assert_frame_equal(df, expected)
+        assert df["Value"].tolist()[:3] == ["0", "1", "2"]
+        assert pd.isna(df["Value"].iloc[20])
+
+    def test_extract_parallel_bool_with_missing_value(self, tmp_path: Path) -> None:
+        """
+        Tests that a boolean column with a missing value in one range keeps Python booleans.
+
+        Args:
+            tmp_path (Path): Temporary directory for test files.
+
+        Returns:
+            None
+        """
+        file = tmp_path / "flags.csv"
+        flags = [str(i % 2 == 0) for i in range(40)] + [""]
+        file.write_text("Flag,Value\n" + "".join(f"{flag},{i}\n" for i, flag in enumerate(flags)))
+
+        expected = extract(file)
+        df = extract(file, workers=4)
+        pd.testing.assert_frame_equal(df, expected)
+        assert df["Flag"].tolist()[:2] == [True, False]
+
+    def test_extract_parallel_range_size(self, quoted_csv: Path) -> None:
+        """
+        Tests parallel extraction with ranges smaller than the file share of each worker.
+
+        Args:
+            quoted_csv (Path): Path to a CSV file with quoted fields.
+
+        Returns:
+            None
+        """
+        expected = extract(quoted_csv)
+        pd.testing.assert_frame_equal(extract(quoted_csv, workers=2, range_size=64), expected)
+
+    def test_extract_chunks_range_size(self, quoted_csv: Path) -> None:
+        """
+        Tests that the number of chunks follows the range size rather than the number of workers.
+
+        Args:
+            quoted_csv (Path): Path to a CSV file with quoted fields.
+
+        Returns:
+            None
+        """
+        chunks = list(extract_chunks(quoted_csv, workers=2, range_size=128))
+        assert len(chunks) > 2
+        assert all(len(chunk) <= 10 for chunk in chunks)
+        assert pd.concat(chunks, ignore_index=True)["Installs"].tolist() == [f"{i},000+" for i in range(50)]
+
+    def test_extract_chunks_stop_early(self, quoted_csv: Path) -> None:
+        """
+        Tests that the chunk stream can be closed before all ranges are parsed.
+
+        Args:
+            quoted_csv (Path): Path to a CSV file with quoted fields.
+
+        Returns:
+            None
+        """
+        chunks = extract_chunks(quoted_csv, workers=2, range_size=64)
+        first = next(chunks)
+        chunks.close()
+        assert first["Installs"].iloc[0] == "0,000+"
+
+    def test_extract_chunks_in_order(self, quoted_csv: Path) -> None:
+        """
+        Tests that chunks are returned in file order.
+
+        Args:
+            quoted_csv (Path): Path to a CSV file with quoted fields.
+
+        Returns:
+            None
+        """
+        chunks = list(extract_chunks(quoted_csv, workers=4))
+        assert len(chunks) > 1
+        assert pd.concat(chunks, ignore_index=True)["Installs"].tolist() == [f"{i},000+" for i in range(50)]
+
+    def test_extract_parallel_pyarrow(self, quoted_csv: Path) -> None:
+        """
+        Tests parallel extraction with the pyarrow CSV engine.
+
+        Args:
+            quoted_csv (Path): Path to a CSV file with quoted fields.
+
+        Returns:
+            None
+        """
+        pytest.importorskip("pyarrow")
+        df = extract(quoted_csv, workers=3, csv_engine="pyarrow")
+        assert df["Installs"].tolist() == [f"{i},000+" for i in range(50)]
+
+    @patch("etl.extract.BLOCK_SIZE", 7)
+    def test_align_offsets_on_record_boundaries(self, quoted_csv: Path) -> None:
+        """
+        Tests that offsets are aligned on record starts, skipping newlines within quoted fields.
+
+        Args:
+            quoted_csv (Path): Path to a CSV file with quoted fields.
+
+        Returns:
+            None
+        """
+        content = quoted_csv.read_bytes()
+        record_starts = {0, len(content)}
+        quoted = False
+        for index, char in enumerate(content):
+            if char == ord('"'):
+                quoted = not quoted
+            elif char == ord("\n") and not quoted:
+                record_starts.add(index + 1)
+
+        offsets = list(range(0, len(content) + 10, 13))
+        aligned = _align_offsets(quoted_csv, offsets)
+        assert all(offset in record_starts for offset in aligned)
+        assert all(offset <= aligned_offset for offset, aligned_offset in zip(offsets, aligned))
+
+    def test_extract_parallel_header_only(self, tmp_path: Path) -> None:
+        """
+        Tests parallel extraction of a file without records.
+
+        Args:
+            tmp_path (Path): Temporary directory for test files.
+
+        Returns:
+            None
+        """
+        file = tmp_path / "header.csv"
+        file.write_text("Column1,Column2\n")
+        df = extract(file, workers=2)
+        assert df.empty
+        assert list(df.columns) == ["Column1", "Column2"]
+
+    def test_extract_parallel_missing_file(self) -> None:
+        """
+        Tests handling a missing file scenario in parallel extraction.
+
+        Returns:
+            None
+        """
+        with pytest.raises(FileNotFoundError):
+            extract(Path("nonexistent.csv"), workers=2)
@@ -1,12 +1,12 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 from sqlalchemy.engine import Engine
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.sql import text
 
-from etl.load import load
+from etl.load import _load_chunk, _resumable_offsets, load
 
 
 @pytest.mark.unit
@@ -86,3 +86,294 @@ class TestLoad:
 
         with pytest.raises(ValueError):
             load(sample_data, invalid_table_name, db_connection.url)
+
+
+@pytest.mark.unit
+class TestChunkedLoad:
+    @staticmethod
+    def load_interrupted(data: pd.DataFrame, table_name: str, db_connection_string: object, **kwargs: object) -> None:
+        """
+        Runs a chunked load that fails after committing its first chunk.
+        """
+
+        def failing_load_chunk(*args: object) -> None:
+            if args[-1] > 0:
+                raise SQLAlchemyError("Connection lost")
+            _load_chunk(*args)
+
+        with patch("etl.load._load_chunk", side_effect=failing_load_chunk), pytest.raises(SQLAlchemyError):
+            load(data, table_name, db_connection_string, **kwargs)
+
+    @pytest.fixture
+    def large_data(self) -> pd.DataFrame:
+        """
+        Provides data spanning several chunks.
+
+        Returns:
+            pd.DataFrame: DataFrame with ten rows.
+        """
+        return pd.DataFrame({"Column1": range(10), "Column2": list("ABCDEFGHIJ")})
+
+    def test_load_in_chunks(self, large_data: pd.DataFrame, sqlite_connection: Engine) -> None:
+        """
+        Tests loading data in checkpointed chunks.
+
+        Args:
+            large_data (pd.DataFrame): Data spanning several chunks.
+            sqlite_connection (Engine): SQLAlchemy engine connected to a SQLite database.
+
+        Returns:
+            None
+        """
+        load(large_data, "chunked_table", sqlite_connection.url, chunk_size=3, batch_id="batch")
+
+        with sqlite_connection.connect() as conn:
+            result = conn.execute(text("SELECT Column1 FROM chunked_table ORDER BY Column1")).scalars().all()
+            checkpoint_count = conn.execute(text("SELECT COUNT(*) FROM etl_load_checkpoints")).scalar()
+
+        assert result == list(range(10)), "Row mismatch"
+        assert checkpoint_count == 0, "Checkpoints should be removed once the load completes"
+
+    def test_load_resumes_after_failure(self, large_data: pd.DataFrame, sqlite_connection: Engine) -> None:
+        """
+        Tests that a restarted load skips chunks committed before the failure.
+
+        Args:
+            large_data (pd.DataFrame): Data spanning several chunks.
+            sqlite_connection (Engine): SQLAlchemy engine connected to a SQLite database.
+
+        Returns:
+            None
+        """
+        calls = []
+
+        def failing_load_chunk(*args: object) -> None:
+            calls.append(args[-1])
+            if len(calls) == 3:
+                raise SQLAlchemyError("Connection lost")
+            _load_chunk(*args)
+
+        with patch("etl.load._load_chunk", side_effect=failing_load_chunk), pytest.raises(SQLAlchemyError):
+            load(large_data, "resumed_table", sqlite_connection.url, chunk_size=3)
+
+        with patch("etl.load._load_chunk", wraps=_load_chunk) as mock_load_chunk:
+            load(large_data, "resumed_table", sqlite_connection.url, chunk_size=3)
+
+        # Only the failed and remaining chunks are loaded again
+        assert [call.args[-1] for call in mock_load_chunk.call_args_list] == [6, 9]
+        with sqlite_connection.connect() as conn:
+            result = conn.execute(text("SELECT Column1 FROM resumed_table ORDER BY Column1")).scalars().all()
+        assert result == list(range(10)), "Rows should be loaded exactly once"
+
+    def test_load_replace_then_reload(self, large_data: pd.DataFrame, sqlite_connection: Engine) -> None:
+        """
+        Tests that reloading earlier data after another load replaces the table again.
+
+        Args:
+            large_data (pd.DataFrame): Data spanning several chunks.
+            sqlite_connection (Engine): SQLAlchemy engine connected to a SQLite database.
+
+        Returns:
+            None
+        """
+        other_data = pd.DataFrame({"Column1": [100, 101, 102], "Column2": ["X", "Y", "Z"]})
+
+        load(large_data, "reloaded_table", sqlite_connection.url, chunk_size=2)
+        load(other_data, "reloaded_table", sqlite_connection.url, chunk_size=2)
+        load(large_data, "reloaded_table", sqlite_connection.url, chunk_size=2)
+
+        with sqlite_connection.connect() as conn:
+            result = conn.execute(text("SELECT Column1 FROM reloaded_table ORDER BY Column1")).scalars().all()
+        assert result == list(range(10)), "Table should hold the last loaded data"
+
+    def test_load_interrupted_batch_after_replace(self, large_data: pd.DataFrame, sqlite_connection: Engine) -> None:
+        """
+        Tests that an interrupted batch starts over once another load has replaced the table.
+
+        Args:
+            large_data (pd.DataFrame): Data spanning several chunks.
+            sqlite_connection (Engine): SQLAlchemy engine connected to a SQLite database.
+
+        Returns:
+            None
+        """
+        other_data = pd.DataFrame({"Column1": [100, 101, 102], "Column2": ["X", "Y", "Z"]})
+
+        def failing_load_chunk(*args: object) -> None:
+            if args[-1] > 0:
+                raise SQLAlchemyError("Connection lost")
+            _load_chunk(*args)
+
+        with patch("etl.load._load_chunk", side_effect=failing_load_chunk), pytest.raises(SQLAlchemyError):
+            load(large_data, "interrupted_table", sqlite_connection.url, chunk_size=3, batch_id="batch")
+        load(other_data, "interrupted_table", sqlite_connection.url, chunk_size=3)
+        load(large_data, "interrupted_table", sqlite_connection.url, chunk_size=3, batch_id="batch")
+
+        with sqlite_connection.connect() as conn:
+            result = conn.execute(text("SELECT Column1 FROM interrupted_table ORDER BY Column1")).scalars().all()
+        assert result == list(range(10)), "Rows of the other load should be replaced"
+
+    def test_load_batch_id_reused_for_another_table(self, large_data: pd.DataFrame, sqlite_connection: Engine) -> None:
+        """
+        Tests that checkpoints of a batch id do not skip chunks of another table.
+
+        Args:
+            large_data (pd.DataFrame): Data spanning several chunks.
+            sqlite_connection (Engine): SQLAlchemy engine connected to a SQLite database.
+
+        Returns:
+            None
+        """
+        def failing_load_chunk(*args: object) -> None:
+            if args[-1] > 0:
+                raise SQLAlchemyError("Connection lost")
+            _load_chunk(*args)
+
+        with patch("etl.load._load_chunk", side_effect=failing_load_chunk), pytest.raises(SQLAlchemyError):
+            load(large_data, "first_table", sqlite_connection.url, chunk_size=3, batch_id="batch")
+
+        load(large_data, "second_table", sqlite_connection.url, chunk_size=3, batch_id="batch")
+
+        with sqlite_connection.connect() as conn:
+            result = conn.execute(text("SELECT COUNT(*) FROM second_table")).scalar()
+        assert result == len(large_data), "All chunks of the second table should be loaded"
+
+    def test_load_chunk_idempotent(self, large_data: pd.DataFrame, sqlite_connection: Engine) -> None:
+        """
+        Tests that loading an already committed chunk again is a no-op.
+
+        Args:
+            large_data (pd.DataFrame): Data spanning several chunks.
+            sqlite_connection (Engine): SQLAlchemy engine connected to a SQLite database.
+
+        Returns:
+            None
+        """
+        _resumable_offsets(sqlite_connection, "idempotent_table", "batch", 5)
+        _load_chunk(sqlite_connection, large_data.iloc[:5], "idempotent_table", "batch", 5, 0)
+        _load_chunk(sqlite_connection, large_data.iloc[:5], "idempotent_table", "batch", 5, 0)
+
+        with sqlite_connection.connect() as conn:
+            result = conn.execute(text("SELECT COUNT(*) FROM idempotent_table")).scalar()
+        assert result == 5, "Chunk should not be loaded twice"
+
+    @patch("etl.load.time.sleep")
+    def test_load_retries_transient_errors(self, mock_sleep: MagicMock, large_data: pd.DataFrame, sqlite_connection: Engine) -> None:
+        """
+        Tests retrying a chunk with exponential backoff when the connection drops.
+
+        Args:
+            mock_sleep (MagicMock): Mocked time.sleep.
+            large_data (pd.DataFrame): Data spanning several chunks.
+            sqlite_connection (Engine): SQLAlchemy engine connected to a SQLite database.
+
+        Returns:
+            None
+        """
+        error = OperationalError("INSERT", {}, Exception("Connection reset"), connection_invalidated=True)
+        side_effect = [error, error, None]
+
+        with patch("etl.load._load_chunk", side_effect=side_effect) as mock_load_chunk:
+            load(large_data, "retried_table", sqlite_connection.url, chunk_size=10, backoff=0.5)
+
+        assert mock_load_chunk.call_count == 3
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    @patch("etl.load.time.sleep")
+    def test_load_gives_up_after_max_retries(self, mock_sleep: MagicMock, large_data: pd.DataFrame, sqlite_connection: Engine) -> None:
+        """
+        Tests that a persistent connection error is raised once retries are exhausted.
+
+        Args:
+            mock_sleep (MagicMock): Mocked time.sleep.
+            large_data (pd.DataFrame): Data spanning several chunks.
+            sqlite_connection (Engine): SQLAlchemy engine connected to a SQLite database.
+
+        Returns:
+            None
+        """
+        error = OperationalError("INSERT", {}, Exception("Connection reset"), connection_invalidated=True)
+
+        with patch("etl.load._load_chunk", side_effect=error) as mock_load_chunk, pytest.raises(OperationalError):
+            load(large_data, "failed_table", sqlite_connection.url, chunk_size=10, max_retries=2)
+
+        assert mock_load_chunk.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("etl.load.time.sleep")
+    def test_load_does_not_retry_permanent_errors(self, mock_sleep: MagicMock, large_data: pd.DataFrame, sqlite_connection: Engine) -> None:
+        """
+        Tests that errors other than dropped connections fail immediately.
+
+        Args:
+            mock_sleep (MagicMock): Mocked time.sleep.
+            large_data (pd.DataFrame): Data spanning several chunks.
+            sqlite_connection (Engine): SQLAlchemy engine connected to a SQLite database.
+
+        Returns:
+            None
+        """
+        error = OperationalError("INSERT", {}, Exception("password authentication failed"))
+
+        with patch("etl.load._load_chunk", side_effect=error) as mock_load_chunk, pytest.raises(OperationalError):
+            load(large_data, "failed_table", sqlite_connection.url, chunk_size=10)
+
+        assert mock_load_chunk.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_load_resume_after_plain_load(self, large_data: pd.DataFrame, sqlite_connection: Engine) -> None:
+        """
+        Tests that an interrupted batch starts over once a plain load has replaced the table.
+
+        Args:
+            large_data (pd.DataFrame): Data spanning several chunks.
+            sqlite_connection (Engine): SQLAlchemy engine connected to a SQLite database.
+
+        Returns:
+            None
+        """
+        other_data = pd.DataFrame({"Column1": [100, 101], "Column2": ["X", "Y"]})
+
+        self.load_interrupted(large_data, "plain_table", sqlite_connection.url, chunk_size=3)
+        load(other_data, "plain_table", sqlite_connection.url)
+        load(large_data, "plain_table", sqlite_connection.url, chunk_size=3)
+
+        with sqlite_connection.connect() as conn:
+            result = conn.execute(text("SELECT Column1 FROM plain_table ORDER BY Column1")).scalars().all()
+        assert result == list(range(10)), "Rows of the plain load should be replaced"
+
+    def test_load_resume_with_different_chunk_size(self, large_data: pd.DataFrame, sqlite_connection: Engine) -> None:
+        """
+        Tests that resuming a batch with another chunk size is refused.
+
+        Args:
+            large_data (pd.DataFrame): Data spanning several chunks.
+            sqlite_connection (Engine): SQLAlchemy engine connected to a SQLite database.
+
+        Returns:
+            None
+        """
+        self.load_interrupted(large_data, "resized_table", sqlite_connection.url, chunk_size=3, batch_id="batch")
+
+        with pytest.raises(ValueError):
+            load(large_data, "resized_table", sqlite_connection.url, chunk_size=4, batch_id="batch")
+
+    def test_load_resume_after_table_dropped(self, large_data: pd.DataFrame, sqlite_connection: Engine) -> None:
+        """
+        Tests that an interrupted batch starts over when its table was dropped.
+
+        Args:
+            large_data (pd.DataFrame): Data spanning several chunks.
+            sqlite_connection (Engine): SQLAlchemy engine connected to a SQLite database.
+
+        Returns:
+            None
+        """
+        self.load_interrupted(large_data, "dropped_table", sqlite_connection.url, chunk_size=3)
+        with sqlite_connection.begin() as conn:
+            conn.execute(text("DROP TABLE dropped_table"))
+        load(large_data, "dropped_table", sqlite_connection.url, chunk_size=3)
+
+        with sqlite_connection.connect() as conn:
+            result = conn.execute(text("SELECT Column1 FROM dropped_table ORDER BY Column1")).scalars().all()
+        assert result == list(range(10)), "All rows should be loaded again"
@@ -1,7 +1,13 @@
+import typing as t
+from unittest.mock import MagicMock, patch
+
 import pandas as pd
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Engine
+from sqlalchemy.types import BIGINT, TEXT
 
-from etl.transform import transform
+from etl.transform import _NUMERIC_PATTERN, _build_transform_query, transform, transform_in_db
 
 
 @pytest.mark.unit
@@ -165,3 +171,158 @@ class TestTransform:
         """
         transformed = transform(apps=apps_data)
         assert transformed.equals(apps_data)
+
+
+@pytest.mark.unit
+class TestTransformInDb:
+    @staticmethod
+    def assert_parity(engine: Engine, apps: pd.DataFrame, reviews: pd.DataFrame = None, **kwargs: t.Any) -> pd.DataFrame:
+        """
+        Runs both transformation paths and checks that they produce the same data.
+        """
+        apps.to_sql("apps", engine, index=False)
+        if reviews is not None:
+            reviews.to_sql("reviews", engine, index=False)
+
+        transform_in_db("apps", "result", engine.url, reviews_table="reviews" if reviews is not None else None, **kwargs)
+        actual = pd.read_sql("SELECT * FROM result", engine)
+        expected = transform(apps=apps, reviews=reviews, **kwargs).reset_index(drop=True)
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+        return actual
+
+    def test_transform_in_db_basic(self, sqlite_connection: Engine, apps_data: pd.DataFrame) -> None:
+        """
+        Tests database-side transformation without additional filters.
+        """
+        result = self.assert_parity(sqlite_connection, apps_data)
+        assert len(result) == len(apps_data)
+
+    def test_transform_in_db_with_conditions(self, sqlite_connection: Engine, apps_data: pd.DataFrame, reviews_data: pd.DataFrame) -> None:
+        """
+        Tests database-side transformation with the filters used by the pipeline.
+        """
+        result = self.assert_parity(
+            sqlite_connection,
+            apps_data,
+            reviews_data,
+            category="FOOD_AND_DRINK",
+            min_rating=4.0,
+            min_reviews=1000,
+            aggregate_reviews=True,
+            columns_to_keep=["App", "Rating", "Reviews", "Installs", "Sentiment_Polarity"],
+            sort_by=["Rating", "Reviews"],
+        )
+        assert result["App"].tolist() == ["App1"]
+
+    def test_transform_in_db_aggregate_reviews(self, sqlite_connection: Engine, apps_data: pd.DataFrame, reviews_data: pd.DataFrame) -> None:
+        """
+        Tests averaging reviews per app inside the database.
+        """
+        reviews = pd.concat([reviews_data, pd.DataFrame({"App": ["App1", "Unknown"], "Sentiment_Polarity": [0.2, 0.9]})])
+        result = self.assert_parity(sqlite_connection, apps_data, reviews, aggregate_reviews=True, sort_by="Rating")
+        assert result.loc[result["App"] == "App1", "Sentiment_Polarity"].iloc[0] == pytest.approx(0.5)
+
+    def test_transform_in_db_merge_reviews(self, sqlite_connection: Engine, apps_data: pd.DataFrame, reviews_data: pd.DataFrame) -> None:
+        """
+        Tests joining reviews row by row inside the database.
+        """
+        reviews = pd.concat([reviews_data, pd.DataFrame({"App": ["App1"], "Sentiment_Polarity": [0.2]})])
+        result = self.assert_parity(sqlite_connection, apps_data, reviews, sort_by=["Reviews", "Sentiment_Polarity"])
+        assert len(result) == len(apps_data) + 1
+
+    def test_transform_in_db_coerces_numeric_text(self, sqlite_connection: Engine, apps_data: pd.DataFrame) -> None:
+        """
+        Tests that text ratings and reviews are converted like pd.to_numeric, unparsable values becoming missing.
+        """
+        apps = apps_data.assign(Rating=["4.5", "Varies with device", "3.5"], Reviews=["3.0M", "10", " 200 "])
+        result = self.assert_parity(sqlite_connection, apps)
+        assert result["Rating"].isna().tolist() == [False, True, False]
+        assert result["Reviews"].isna().tolist() == [True, False, False]
+
+    def test_transform_in_db_filters_numeric_text(self, sqlite_connection: Engine, apps_data: pd.DataFrame) -> None:
+        """
+        Tests that unparsable text values do not pass the min_rating and min_reviews filters.
+        """
+        apps = apps_data.assign(Rating=["4.5", "Varies with device", "4.8"], Reviews=["3.0M", "1500", "2000"])
+        result = self.assert_parity(sqlite_connection, apps, min_rating=4.0, min_reviews=1000)
+        assert result["App"].tolist() == ["App3"]
+
+    def test_transform_in_db_postgresql_query(self) -> None:
+        """
+        Tests the query compiled for PostgreSQL, without a live server.
+        """
+        engine = MagicMock(dialect=postgresql.dialect())
+        inspector = MagicMock()
+        inspector.get_columns.return_value = [{"name": "App", "type": TEXT()}, {"name": "Rating", "type": TEXT()}, {"name": "Reviews", "type": BIGINT()}]
+        with patch("etl.transform.inspect", return_value=inspector):
+            query, params = _build_transform_query(engine, "apps", "result", min_rating=4.0)
+
+        assert 'CAST(a."Rating" AS TEXT) ~ :numeric_pattern THEN CAST(a."Rating" AS DOUBLE PRECISION)' in query
+        assert 'a."Reviews" AS "Reviews"' in query
+        assert params == {"numeric_pattern": _NUMERIC_PATTERN, "min_rating": 4.0}
+
+    def test_transform_in_db_append(self, sqlite_connection: Engine, apps_data: pd.DataFrame) -> None:
+        """
+        Tests appending transformed rows to an existing table.
+        """
+        apps_data.to_sql("apps", sqlite_connection, index=False)
+        transform_in_db("apps", "result", sqlite_connection.url, min_rating=4.0)
+        transform_in_db("apps", "result", sqlite_connection.url, if_exists="append", category="GAME")
+        result = pd.read_sql("SELECT * FROM result", sqlite_connection)
+        assert result["App"].tolist() == ["App1", "App2"]
+
+    def test_transform_in_db_parameterized(self, sqlite_connection: Engine, apps_data: pd.DataFrame) -> None:
+        """
+        Tests that filter values are bound as parameters rather than inlined.
+        """
+        apps_data.to_sql("apps", sqlite_connection, index=False)
+        query, params = _build_transform_query(sqlite_connection, "apps", "result", category="FOOD_AND_DRINK", min_rating=4.0)
+        assert query.startswith('CREATE TABLE result AS SELECT')
+        assert "FOOD_AND_DRINK" not in query
+        assert params == {"category": "FOOD_AND_DRINK", "min_rating": 4.0}
+
+    def test_transform_in_db_aggregates_filtered_apps_only(self, sqlite_connection: Engine, apps_data: pd.DataFrame, reviews_data: pd.DataFrame) -> None:
+        """
+        Tests that only the reviews of apps kept by the category filter are averaged.
+        """
+        apps_data.to_sql("apps", sqlite_connection, index=False)
+        reviews_data.to_sql("reviews", sqlite_connection, index=False)
+        query, params = _build_transform_query(sqlite_connection, "apps", "result", "reviews", category="GAME", aggregate_reviews=True)
+        assert 'FROM reviews WHERE "App" IN (SELECT "App" FROM apps WHERE "Category" = :category) GROUP BY "App"' in query
+        assert params == {"category": "GAME"}
+
+        transform_in_db("apps", "result", sqlite_connection.url, reviews_table="reviews", category="GAME", aggregate_reviews=True)
+        result = pd.read_sql("SELECT * FROM result", sqlite_connection)
+        expected = transform(apps=apps_data, reviews=reviews_data, category="GAME", aggregate_reviews=True).reset_index(drop=True)
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_transform_in_db_invalid_columns(self, sqlite_connection: Engine, apps_data: pd.DataFrame) -> None:
+        """
+        Tests database-side transformation with invalid columns to keep.
+        """
+        apps_data.to_sql("apps", sqlite_connection, index=False)
+        with pytest.raises(KeyError):
+            transform_in_db("apps", "result", sqlite_connection.url, columns_to_keep=["NonexistentColumn"])
+
+    def test_transform_in_db_invalid_table_name(self, sqlite_connection: Engine) -> None:
+        """
+        Tests database-side transformation with an invalid table name.
+        """
+        with pytest.raises(ValueError):
+            transform_in_db("apps", "invalid-table-name!", sqlite_connection.url)
+
+    def test_transform_in_db_replace_source_table(self, sqlite_connection: Engine) -> None:
+        """
+        Tests that replacing a source table with its own transformation is rejected.
+        """
+        with pytest.raises(ValueError):
+            transform_in_db("apps", "apps", sqlite_connection.url)
+        with pytest.raises(ValueError):
+            transform_in_db("apps", "reviews", sqlite_connection.url, reviews_table="reviews")
+
+    def test_transform_in_db_drop_duplicates_unsupported(self, sqlite_connection: Engine) -> None:
+        """
+        Tests that drop_duplicates is rejected in database-side transformation.
+        """
+        with pytest.raises(ValueError):
+            transform_in_db("apps", "result", sqlite_connection.url, drop_duplicates=True)